@@ -1,22 +1,17 @@
 """Health check endpoints."""
-from typing import Dict, Any
 from fastapi import APIRouter, Depends, Request, status
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from app.dependencies.exiftool import check_exiftool
 from app.core.config import settings
+from app.core.limiter import limiter
 
 # Create router
 router = APIRouter(tags=["Health"])
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
 
-
-@router.get("/", response_model=Dict[str, str], status_code=status.HTTP_200_OK)
+@router.get("/", status_code=status.HTTP_200_OK)
 @limiter.limit("30/minute")
-async def root(request: Request) -> Dict[str, str]:
+async def root(request: Request):
     """
     Root endpoint to verify API is running.
 
@@ -29,9 +24,9 @@ async def root(request: Request) -> Dict[str, str]:
     return {"message": "EXIF Checker API is running"}
 
 
-@router.get("/health", response_model=Dict[str, Any], status_code=status.HTTP_200_OK)
+@router.get("/health", status_code=status.HTTP_200_OK)
 @limiter.limit("30/minute")
-async def health_check(request: Request, _=Depends(check_exiftool)) -> Dict[str, Any]:
+async def health_check(request: Request, _=Depends(check_exiftool)):
     """
     Health check endpoint to verify dependencies are installed.
 
@@ -49,5 +44,6 @@ async def health_check(request: Request, _=Depends(check_exiftool)) -> Dict[str,
             "max_file_size": settings.MAX_FILE_SIZE,
             "version": "1.0.0",
             "environment": settings.ENVIRONMENT,
+            "temp_dir_backend": settings.TEMP_DIR_BACKEND,
         },
     }
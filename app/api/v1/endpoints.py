@@ -1,5 +1,7 @@
 """API endpoints for EXIF data operations."""
+import asyncio
 import os
+import tempfile
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from fastapi import (
@@ -12,7 +14,13 @@ from fastapi import (
     Form,
     status,
 )
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    ORJSONResponse,
+    StreamingResponse,
+)
+import orjson
 import shutil
 import logging
 from datetime import datetime
@@ -24,16 +32,16 @@ from app.models.exif import (
     BatchExifResponse,
     ErrorResponse,
 )
-from app.services.exif_service import exif_service
+from app.services.exif_service import EXIF_EXECUTOR, exif_service
 from app.core.utils import (
+    ensure_directory_exists,
     validate_image_file,
     validate_fuji_file,
     format_date_for_filename,
     sanitize_filename,
 )
 from app.core.config import settings
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from app.core.limiter import limiter
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -41,11 +49,14 @@ logger = logging.getLogger(__name__)
 # Create API router
 router = APIRouter(tags=["EXIF"])
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
-
 # Constants
 MAX_FILE_SIZE_MB = 50.0  # Hard-coded to 50MB
+_MAX_BYTES = int(MAX_FILE_SIZE_MB * 1024 * 1024)  # Resolved once at import
+
+# Precompiled pieces for the rename proposal: the metadata keys used to
+# build the filename, and a translation table replacing spaces in one pass
+_RENAME_KEYS = ("DateTimeOriginal", "Model", "LensModel", "Aperture", "ShutterSpeed", "ISO")
+_SPACE_TR = str.maketrans(" ", "_")
 
 
 def validate_file_size(file: UploadFile, max_size_mb: float = MAX_FILE_SIZE_MB) -> None:
@@ -59,18 +70,30 @@ def validate_file_size(file: UploadFile, max_size_mb: float = MAX_FILE_SIZE_MB)
     Raises:
         HTTPException: If the file size exceeds the maximum allowed size
     """
-    # Get file size
-    file.file.seek(0, os.SEEK_END)
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset file position
-
-    # Convert max size to bytes
-    max_size_bytes = max_size_mb * 1024 * 1024
-
-    # Log file size for debugging
-    logger.debug(
-        f"File size: {file_size} bytes, Max size: {max_size_bytes} bytes ({max_size_mb} MB)"
-    )
+    # Starlette already knows the size from the multipart framing; use it
+    # rather than seeking, which forces the spool to materialize on disk
+    file_size = getattr(file, "size", None)
+    if file_size is None:
+        file.file.seek(0, os.SEEK_END)
+        file_size = file.file.tell()
+        file.file.seek(0)  # Reset file position
+
+    # Use the precomputed byte limit for the default; only convert when a
+    # caller passes a custom limit
+    if max_size_mb == MAX_FILE_SIZE_MB:
+        max_size_bytes = _MAX_BYTES
+    else:
+        max_size_bytes = int(max_size_mb * 1024 * 1024)
+
+    # Log file size for debugging (lazy so nothing is formatted unless
+    # debug logging is actually enabled)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "File size: %s bytes, Max size: %s bytes (%s MB)",
+            file_size,
+            max_size_bytes,
+            max_size_mb,
+        )
 
     if file_size > max_size_bytes:
         logger.warning(
@@ -82,7 +105,7 @@ def validate_file_size(file: UploadFile, max_size_mb: float = MAX_FILE_SIZE_MB)
         )
 
 
-@router.post("/analyze", response_model=Dict[str, Any], status_code=status.HTTP_200_OK)
+@router.post("/analyze", status_code=status.HTTP_200_OK)
 @limiter.limit("10/minute")
 async def analyze_exif(
     request: Request, file: UploadFile = File(...), _=Depends(check_exiftool)
@@ -111,25 +134,20 @@ async def analyze_exif(
     # Validate file size
     validate_file_size(file, max_size_mb=MAX_FILE_SIZE_MB)
 
-    # Save the uploaded file
-    temp_file_path = await exif_service.save_upload_file(file)
-
     try:
-        # Process the file with ExifTool
-        metadata = exif_service.parse_exif_metadata(temp_file_path)
+        # Process the file with ExifTool (in memory, no temp file)
+        metadata = await exif_service.extract_metadata(file)
 
         # Return the metadata
         return {"filename": file.filename, "metadata": metadata}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error processing file: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing file: {str(e)}",
         )
-    finally:
-        # Clean up the temporary file
-        if temp_file_path.exists():
-            temp_file_path.unlink()
 
 
 @router.post("/fuji", response_model=FujiRecipeResponse, status_code=status.HTTP_200_OK)
@@ -162,29 +180,25 @@ async def analyze_fuji_recipe(
     # Validate file size
     validate_file_size(file, max_size_mb=MAX_FILE_SIZE_MB)
 
-    # Save the uploaded file
-    temp_file_path = await exif_service.save_upload_file(file)
-
     try:
-        # Process the file to extract Fujifilm recipe
-        response_data = exif_service.parse_fuji_metadata(temp_file_path)
-
-        return response_data
+        # Process the file to extract Fujifilm recipe (in memory, no temp file)
+        response_data = await exif_service.extract_fuji_metadata(file)
+
+        # Serialize straight through orjson; returning a Response skips
+        # FastAPI's jsonable_encoder pass while response_model still
+        # documents the schema
+        return ORJSONResponse(response_data.model_dump())
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error processing Fujifilm image: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing Fujifilm image: {str(e)}",
         )
-    finally:
-        # Clean up the temporary file
-        if temp_file_path.exists():
-            temp_file_path.unlink()
 
 
-@router.post(
-    "/batch", response_model=List[Dict[str, Any]], status_code=status.HTTP_200_OK
-)
+@router.post("/batch", status_code=status.HTTP_200_OK)
 @limiter.limit("5/minute")
 async def analyze_batch(
     request: Request, files: List[UploadFile] = File(...), _=Depends(check_exiftool)
@@ -192,13 +206,19 @@ async def analyze_batch(
     """
     Batch process multiple images for EXIF data.
 
+    All valid files are saved concurrently into a per-request temp
+    directory and handed to ExifTool in a single invocation, so the
+    whole batch costs one process spawn instead of one per file.
+    Results are streamed as NDJSON (one JSON object per line); failed
+    files are streamed as objects with an "error" key.
+
     Args:
         request: The request object
         files: List of uploaded image files
         _: Dependency to check if ExifTool is available
 
     Returns:
-        A list of dictionaries containing the filename and extracted metadata for each file
+        A streaming NDJSON response with one result object per file
 
     Raises:
         HTTPException: If no files are provided
@@ -208,52 +228,117 @@ async def analyze_batch(
             status_code=status.HTTP_400_BAD_REQUEST, detail="No files provided"
         )
 
-    # Prepare result containers
-    results = []
-    errors = []
-
-    for file in files:
-        # Check file extension
+    # Validate and persist the uploads here, while they are still open:
+    # FastAPI closes form files when the handler returns, before the
+    # streaming body runs, so per-file I/O cannot be deferred into the
+    # generator. Invalid files never touch disk.
+    error_lines = []
+    valid = []
+    for index, file in enumerate(files):
         if not validate_image_file(file.filename):
-            errors.append(
-                {"filename": file.filename, "error": "Unsupported file format"}
+            error_lines.append(
+                orjson.dumps(
+                    {"filename": file.filename, "error": "Unsupported file format"}
+                )
+                + b"\n"
             )
             continue
-
         try:
-            # Validate file size
             validate_file_size(file, max_size_mb=MAX_FILE_SIZE_MB)
-
-            # Save the uploaded file
-            temp_file_path = await exif_service.save_upload_file(file)
-
-            try:
-                # Process the file with ExifTool
-                metadata = exif_service.parse_exif_metadata(temp_file_path)
-
-                # Add to successful results
-                results.append({"filename": file.filename, "metadata": metadata})
-            except Exception as e:
-                logger.error(f"Error processing file {file.filename}: {str(e)}")
-                # Add to errors
-                errors.append({"filename": file.filename, "error": str(e)})
-            finally:
-                # Clean up the temporary file
-                if temp_file_path.exists():
-                    temp_file_path.unlink()
         except HTTPException as e:
-            # Add to errors
-            errors.append({"filename": file.filename, "error": e.detail})
-
-    # Include errors in the response if there are any
-    if errors:
-        logger.warning(f"Batch processing completed with {len(errors)} errors")
-
-    # Return results
-    return results
-
+            error_lines.append(
+                orjson.dumps({"filename": file.filename, "error": e.detail}) + b"\n"
+            )
+            continue
+        valid.append((index, file))
+
+    # Per-request temp dir so cleanup is one rmtree and duplicate upload
+    # names can't collide; it outlives the handler and is removed when
+    # the stream finishes. A failed save (e.g. content that fails the
+    # magic check) becomes an error line rather than aborting the stream.
+    tmp_dir = None
+    saved = []
+    if valid:
+        ensure_directory_exists(settings.TEMP_DIR)
+        tmp_dir = tempfile.mkdtemp(dir=settings.TEMP_DIR)
+        saved = await asyncio.gather(
+            *[
+                exif_service.save_upload_file(
+                    file, directory=tmp_dir, filename=f"{index}_{sanitize_filename(file.filename)}"
+                )
+                for index, file in valid
+            ],
+            return_exceptions=True,
+        )
 
-@router.post("/rename", response_model=Dict[str, str], status_code=status.HTTP_200_OK)
+    async def _stream():
+        """Yield one NDJSON line per file; only exiftool runs in here."""
+        errors = len(error_lines)
+        try:
+            for line in error_lines:
+                yield line
+
+            if valid:
+                paths = [p for p in saved if not isinstance(p, BaseException)]
+
+                # One exiftool invocation for the whole batch, on the
+                # dedicated exiftool executor. The 200 and headers are
+                # already on the wire here, so a failed invocation can't
+                # become an error response — report it per file instead
+                # of leaving the client a truncated stream.
+                loop = asyncio.get_running_loop()
+                try:
+                    metadata_by_path = await loop.run_in_executor(
+                        EXIF_EXECUTOR, exif_service.parse_exif_metadata_many, paths
+                    )
+                except HTTPException as e:
+                    logger.error(f"Batch exiftool invocation failed: {e.detail}")
+                    metadata_by_path = None
+                    batch_error = e.detail
+                except Exception as e:
+                    logger.error(f"Batch exiftool invocation failed: {str(e)}")
+                    metadata_by_path = None
+                    batch_error = "Error processing batch images"
+
+                for (index, file), path in zip(valid, saved):
+                    if isinstance(path, BaseException):
+                        errors += 1
+                        detail = (
+                            path.detail
+                            if isinstance(path, HTTPException)
+                            else "Could not save file"
+                        )
+                        yield orjson.dumps(
+                            {"filename": file.filename, "error": detail}
+                        ) + b"\n"
+                        continue
+                    if metadata_by_path is None:
+                        errors += 1
+                        yield orjson.dumps(
+                            {"filename": file.filename, "error": batch_error}
+                        ) + b"\n"
+                        continue
+                    metadata = metadata_by_path.get(str(path))
+                    if metadata is None:
+                        errors += 1
+                        yield orjson.dumps(
+                            {"filename": file.filename, "error": "Could not read metadata"}
+                        ) + b"\n"
+                    else:
+                        yield orjson.dumps(
+                            {"filename": file.filename, "metadata": metadata}
+                        ) + b"\n"
+
+            if errors:
+                logger.warning(f"Batch processing completed with {errors} errors")
+        finally:
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+
+@router.post("/rename", status_code=status.HTTP_200_OK)
 @limiter.limit("10/minute")
 async def rename_proposal(
     request: Request, file: UploadFile = File(...), _=Depends(check_exiftool)
@@ -282,27 +367,20 @@ async def rename_proposal(
     # Validate file size
     validate_file_size(file, max_size_mb=50.0)
 
-    # Save the uploaded file
-    temp_file_path = await exif_service.save_upload_file(file)
-
     try:
-        # Process the file with ExifTool
-        metadata = exif_service.parse_exif_metadata(temp_file_path)
+        # Process the file with ExifTool (in memory, no temp file)
+        metadata = await exif_service.extract_metadata(file)
 
-        # Generate filename components
-        filename, ext = os.path.splitext(file.filename)
-        date_str = metadata.get("DateTimeOriginal", "")
-        camera = metadata.get("Model", "").replace(" ", "_")
-        lens = metadata.get("LensModel", "").replace(" ", "_")
+        # Generate filename components (single pass over the key tuple)
+        ext = file.filename[file.filename.rfind(".") :]
+        date_str, camera, lens, aperture, shutter, iso = (
+            metadata.get(k, "") for k in _RENAME_KEYS
+        )
+        camera = str(camera).translate(_SPACE_TR)
+        lens = str(lens).translate(_SPACE_TR)
 
-        # Get aperture, shutter speed, and ISO if available
-        aperture = metadata.get("Aperture", "")
         aperture_str = f"f{aperture}" if aperture else ""
-
-        shutter = metadata.get("ShutterSpeed", "")
         shutter_str = f"{shutter}s" if shutter else ""
-
-        iso = metadata.get("ISO", "")
         iso_str = f"ISO{iso}" if iso else ""
 
         # Format date
@@ -328,10 +406,8 @@ async def rename_proposal(
                 "iso": iso,
             },
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error processing file for rename: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
-    finally:
-        # Clean up the temporary file
-        if temp_file_path.exists():
-            temp_file_path.unlink()
@@ -1,5 +1,7 @@
 """Application configuration module."""
 import os
+import shutil
+import sys
 import logging
 from typing import List, Dict, Any, Optional
 from pathlib import Path
@@ -10,6 +12,36 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 # Base directory of the application
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
+# Maximum upload size in MB; module-level so the temp-dir probe below
+# can see it before Settings is instantiated
+_MAX_FILE_SIZE_MB = 50.0
+
+
+def _default_temp_dir() -> Path:
+    """
+    Pick the default directory for temporary uploads.
+
+    On Linux, prefer RAM-backed /dev/shm (tmpfs) so the
+    write-upload/read/unlink cycle never touches disk — but only when
+    the mount can hold at least two maximum-size uploads. Docker's
+    default /dev/shm is 64 MB, which a single 50 MB upload nearly
+    fills, so a too-small mount falls back to the disk directory
+    instead of turning concurrent uploads into ENOSPC errors (raise it
+    with docker run --shm-size). Fall back to a local directory
+    elsewhere.
+
+    Returns:
+        Path: Default temporary upload directory
+    """
+    if sys.platform.startswith("linux") and Path("/dev/shm").is_dir():
+        try:
+            total = shutil.disk_usage("/dev/shm").total
+        except OSError:
+            total = 0
+        if total >= 2 * _MAX_FILE_SIZE_MB * 1024 * 1024:
+            return Path("/dev/shm/exif_uploads")
+    return Path("temp_uploads")
+
 
 class Settings(BaseSettings):
     """Application settings using Pydantic for validation and type checking."""
@@ -28,9 +60,12 @@ class Settings(BaseSettings):
 
     # File settings
     # Hardcoded to 50MB to ensure this is the value used
-    max_file_size: float = Field(default=50.0, description="Maximum file size in MB")
+    max_file_size: float = Field(
+        default=_MAX_FILE_SIZE_MB, description="Maximum file size in MB"
+    )
     temp_dir: Path = Field(
-        default=Path("temp_uploads"), description="Directory for temporary files"
+        default_factory=_default_temp_dir,
+        description="Directory for temporary files (tmpfs-backed on Linux)",
     )
 
     # Static file settings
@@ -51,6 +86,21 @@ class Settings(BaseSettings):
         env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="ignore"
     )
 
+    def model_post_init(self, __context) -> None:
+        """
+        Materialize uppercase aliases as real instance attributes.
+
+        Access through both settings.api_v1_str and settings.API_V1_STR
+        is supported; doing this once at construction makes every later
+        attribute lookup a plain dict fetch with no __getattr__ logic.
+        """
+        for name in type(self).model_fields:
+            object.__setattr__(self, name.upper(), getattr(self, name))
+
+        # Computed properties exposed under uppercase names as well
+        object.__setattr__(self, "ALLOWED_ORIGINS", self.allowed_origins)
+        object.__setattr__(self, "TEMP_DIR_BACKEND", self.temp_dir_backend)
+
     def get_log_level(self) -> int:
         """
         Convert string log level to logging module constant.
@@ -67,6 +117,16 @@ class Settings(BaseSettings):
         }
         return levels.get(self.log_level.upper(), logging.INFO)
 
+    @property
+    def temp_dir_backend(self) -> str:
+        """
+        Report which storage backend holds temporary uploads.
+
+        Returns:
+            str: "tmpfs" when the temp dir lives on /dev/shm, otherwise "disk"
+        """
+        return "tmpfs" if str(self.temp_dir).startswith("/dev/shm") else "disk"
+
     @property
     def allowed_origins(self) -> List[str]:
         """
@@ -80,30 +140,16 @@ class Settings(BaseSettings):
         return [origin.strip() for origin in self.allowed_origins_str.split(",")]
 
 
-# Create settings instance
-settings = Settings()
-
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Return the application settings, constructed once and cached.
 
-# Define uppercase aliases for backward compatibility
-# This approach allows access through both settings.api_v1_str and settings.API_V1_STR
-class SettingsProxy:
-    def __init__(self, settings_instance):
-        self._settings = settings_instance
+    Returns:
+        Settings: The cached settings instance
+    """
+    return Settings()
 
-    def __getattr__(self, name):
-        # Try to get the lowercase version if uppercase is requested
-        if name.isupper():
-            lowercase_name = name.lower()
-            if hasattr(self._settings, lowercase_name):
-                return getattr(self._settings, lowercase_name)
 
-            # Special case for allowed_origins which uses a property
-            if name == "ALLOWED_ORIGINS":
-                return self._settings.allowed_origins
-
-        # Fall back to the actual settings instance
-        return getattr(self._settings, name)
-
-
-# Replace the settings instance with our proxy
-settings = SettingsProxy(settings)
+# Create settings instance
+settings = get_settings()
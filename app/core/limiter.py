@@ -0,0 +1,23 @@
+"""Shared rate limiter instance for the application."""
+import os
+
+from slowapi import Limiter
+
+def rate_limit_key(request):
+    """Return the client host used as the rate-limit bucket key.
+
+    request.client is None behind unix-domain sockets and in test
+    clients, so fall back to localhost like slowapi's own
+    get_remote_address does.
+    """
+    client = request.client
+    return client.host if client is not None else "127.0.0.1"
+
+
+# Single Limiter shared by the middleware and all route decorators so they
+# use the same storage. The backend defaults to in-memory but can be
+# pointed at e.g. redis://... via RATELIMIT_STORAGE without code changes.
+limiter = Limiter(
+    key_func=rate_limit_key,
+    storage_uri=os.getenv("RATELIMIT_STORAGE", "memory://"),
+)
@@ -1,144 +1,242 @@
 """Middleware for the application."""
+import json
 import time
 import logging
-from typing import Callable, Awaitable
-from fastapi import FastAPI, Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
 from starlette.types import ASGIApp, Receive, Scope, Send
+
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging requests and response times."""
-
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+# Security headers precomputed once as byte tuples; appending these to the
+# raw ASGI header list avoids per-request str.encode and MutableHeaders work
+_SECURITY_HEADERS = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"content-security-policy", b"default-src 'self'"),
+]
+
+# CORS configuration resolved to bytes once at import time. When the
+# allow-list is "*" every Origin is echoed back; otherwise only origins
+# in the precomputed set get CORS headers.
+_CORS_ALLOW_ANY = "*" in settings.ALLOWED_ORIGINS
+_CORS_ORIGINS = frozenset(
+    origin.encode("latin-1") for origin in settings.ALLOWED_ORIGINS if origin != "*"
+)
+_CORS_STATIC = [
+    (b"access-control-allow-credentials", b"true"),
+    (b"vary", b"Origin"),
+]
+# Browsers ignore wildcard methods/headers for credentialed requests,
+# so the preflight carries the explicit method list and reflects the
+# requested headers — the same expansion CORSMiddleware performs
+_CORS_PREFLIGHT_HEADERS = [
+    *_CORS_STATIC,
+    (
+        b"access-control-allow-methods",
+        b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT",
+    ),
+    (b"access-control-max-age", b"600"),
+    (b"content-length", b"0"),
+]
+
+# Upload size limit, resolved once at import time
+# Hardcoded to 50MB to ensure consistency
+_MAX_SIZE_MB = 50.0
+_MAX_SIZE_BYTES = int(_MAX_SIZE_MB * 1024 * 1024)
+
+# Pre-serialized 413 response so rejection does no per-request work
+_413_BODY = json.dumps(
+    {"detail": f"File size exceeds maximum allowed size of {_MAX_SIZE_MB} MB"}
+).encode("utf-8")
+_413_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_413_BODY)).encode("latin-1")),
+]
+
+
+class RequestLoggingMiddleware:
+    """Pure ASGI middleware for logging requests and response times."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Process the request and log information.
+        Process the request and log method, path, status and duration.
 
         Args:
-            request: The incoming request
-            call_next: The next middleware or route handler
-
-        Returns:
-            The response from the next middleware or route handler
+            scope: The ASGI connection scope
+            receive: The ASGI receive callable
+            send: The ASGI send callable
         """
-        start_time = time.time()
-
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_wrapper(message) -> None:
+            """Capture the response status from http.response.start."""
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        # The exception is caught here directly rather than relying on a
+        # BaseHTTPMiddleware dispatch, so there is no anyio task group to
+        # rewrap it; the finally block logs every request exactly once
         try:
-            # Process the request
-            response = await call_next(request)
-
-            # Calculate processing time
-            process_time = time.time() - start_time
-
-            # Log request details
-            logger.info(
-                f"{request.method} {request.url.path} "
-                f"- Status: {response.status_code} "
-                f"- Process time: {process_time:.4f}s"
-            )
-
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            # Log the error
-            process_time = time.time() - start_time
+            # Note the error, then re-raise for the server's handler
             logger.error(
-                f"{request.method} {request.url.path} "
-                f"- Error: {str(e)} "
-                f"- Process time: {process_time:.4f}s"
+                "%s %s - Error: %s", scope["method"], scope["path"], str(e)
             )
-            # Re-raise the exception for the global exception handler
             raise
+        finally:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "%s %s - Status: %d - Process time: %.4fs",
+                    scope["method"],
+                    scope["path"],
+                    status_code,
+                    (time.perf_counter_ns() - start_ns) * 1e-9,
+                )
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware for adding security headers to responses."""
+class SecurityHeadersMiddleware:
+    """
+    Pure ASGI middleware for adding security and CORS headers to responses.
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        """
-        Process the request and add security headers.
+    CORS is handled in the same send wrapper that appends the security
+    headers, so allowed cross-origin requests don't pay for a separate
+    CORSMiddleware dispatch. Preflight OPTIONS requests from an allowed
+    origin are answered directly with a prebuilt 204.
+    """
 
-        Args:
-            request: The incoming request
-            call_next: The next middleware or route handler
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        Returns:
-            The response with added security headers
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        response = await call_next(request)
-
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers[
-            "Strict-Transport-Security"
-        ] = "max-age=31536000; includeSubDomains"
-        response.headers["Content-Security-Policy"] = "default-src 'self'"
+        Append the security and CORS headers to the outgoing response.
 
-        return response
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive callable
+            send: The ASGI send callable
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Pull the Origin header from the raw scope; absent for the
+        # overwhelmingly common same-origin case. Preflights also need
+        # the requested headers so the 204 can reflect them.
+        is_preflight = scope["method"] == "OPTIONS"
+        origin = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                if _CORS_ALLOW_ANY or value in _CORS_ORIGINS:
+                    origin = value
+                if not is_preflight:
+                    break
+            elif is_preflight and name == b"access-control-request-headers":
+                request_headers = value
+
+        # Answer preflight requests from an allowed origin directly
+        if origin is not None and is_preflight:
+            headers = [
+                (b"access-control-allow-origin", origin),
+                *_CORS_PREFLIGHT_HEADERS,
+                *_SECURITY_HEADERS,
+            ]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 204,
+                    "headers": headers,
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_wrapper(message) -> None:
+            """Extend the response headers on http.response.start."""
+            if message["type"] == "http.response.start":
+                if origin is not None:
+                    message["headers"] = [
+                        *message["headers"],
+                        (b"access-control-allow-origin", origin),
+                        *_CORS_STATIC,
+                        *_SECURITY_HEADERS,
+                    ]
+                else:
+                    message["headers"] = [*message["headers"], *_SECURITY_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class FileUploadSizeMiddleware:
+    """
+    Pure ASGI middleware that rejects oversize request bodies early.
 
+    Checks the declared Content-Length before any of the body has been
+    read, so an oversize upload is refused without paying the cost of
+    streaming it in.
+    """
 
-class FileUploadSizeMiddleware(BaseHTTPMiddleware):
-    """Middleware to handle file upload size at the Starlette level."""
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Check if the request contains a file upload and handle size limits.
+        Short-circuit with a 413 if the declared body size is too large.
 
         Args:
-            request: The incoming request
-            call_next: The next middleware or route handler
-
-        Returns:
-            The response or a 413 error if the file is too large
+            scope: The ASGI connection scope
+            receive: The ASGI receive callable
+            send: The ASGI send callable
         """
-        # Get the content length from the headers
-        content_length = request.headers.get("content-length")
-
-        # Always log max file size for debugging
-        logger.debug(f"MAX_FILE_SIZE is set to {settings.MAX_FILE_SIZE} MB")
-
-        if content_length and request.headers.get("content-type", "").startswith(
-            "multipart/form-data"
-        ):
-            try:
-                # Convert to int
-                content_length = int(content_length)
-
-                # Calculate max size in bytes - HARDCODED to 50MB for testing
-                max_size_mb = 50.0  # Force to 50MB
-                max_size = int(max_size_mb * 1024 * 1024)  # Convert MB to bytes
-
-                logger.info(
-                    f"Upload request detected: {content_length} bytes. Max allowed: {max_size} bytes ({max_size_mb} MB)"
-                )
-
-                # Check if content length exceeds max size
-                if content_length > max_size:
-                    logger.warning(
-                        f"Request size {content_length} bytes exceeds limit of {max_size} bytes"
-                    )
-                    return JSONResponse(
-                        status_code=413,
-                        content={
-                            "detail": f"File size exceeds maximum allowed size of {max_size_mb} MB"
-                        },
-                    )
-            except ValueError:
-                logger.warning(f"Invalid content length header: {content_length}")
+        if scope["type"] == "http":
+            # Scan the raw header list once instead of building a Headers
+            # mapping; the scope already holds lowercase byte tuples
+            content_length = None
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    content_length = value
+                    break
+            if content_length:
+                try:
+                    if int(content_length) > _MAX_SIZE_BYTES:
+                        logger.warning(
+                            "Request size %s bytes exceeds limit of %d bytes",
+                            content_length,
+                            _MAX_SIZE_BYTES,
+                        )
+                        await send(
+                            {
+                                "type": "http.response.start",
+                                "status": 413,
+                                "headers": _413_HEADERS,
+                            }
+                        )
+                        await send({"type": "http.response.body", "body": _413_BODY})
+                        return
+                except ValueError:
+                    logger.warning("Invalid content length header: %s", content_length)
 
         # Continue with the request
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
 
 def add_middleware(app: FastAPI) -> None:
@@ -148,11 +246,10 @@ def add_middleware(app: FastAPI) -> None:
     Args:
         app: The FastAPI application
     """
-    # Add file upload size middleware first (to catch large files before processing)
-    app.add_middleware(FileUploadSizeMiddleware)
-
-    # Add request logging middleware
-    app.add_middleware(RequestLoggingMiddleware)
-
-    # Add security headers middleware
+    # add_middleware prepends, so the last one added runs first. Register
+    # innermost-to-outermost: security headers, then logging, with the
+    # upload size check outermost so oversize bodies are refused before
+    # any other layer touches the request.
     app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(FileUploadSizeMiddleware)
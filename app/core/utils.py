@@ -1,39 +1,42 @@
 """Utility functions for the application."""
 import os
 import json
-import subprocess
+import shutil
+import time
 from datetime import datetime
-from pathlib import Path
 from fastapi import HTTPException
 
 
 def ensure_directory_exists(directory_path):
     """Ensure a directory exists, creating it if necessary"""
-    path = Path(directory_path)
-    path.mkdir(exist_ok=True, parents=True)
-    return path
+    os.makedirs(str(directory_path), exist_ok=True)
+    return directory_path
+
+
+# Translation table dropping colons and mapping spaces to underscores,
+# built once so the date is rewritten in a single C-level pass
+_DATE_TABLE = str.maketrans({":": "", " ": "_"})
 
 
 def format_date_for_filename(date_str):
     """Format a date string for use in filenames"""
-    try:
-        # Try to parse the date string
-        if not date_str or date_str == "Unknown Date":
-            return datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        # Replace colons and spaces for filename safety
-        return date_str.replace(":", "").replace(" ", "_")
-    except Exception:
-        # Fall back to current date/time if parsing fails
+    # Fall back to current date/time when there's no usable date
+    if not date_str or date_str == "Unknown Date":
         return datetime.now().strftime("%Y%m%d_%H%M%S")
 
+    # Replace colons and spaces for filename safety in one pass
+    return date_str.translate(_DATE_TABLE)
+
+
+# Translation table mapping filesystem-unsafe characters to underscores,
+# built once so sanitizing is a single C-level pass
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
 
 def sanitize_filename(filename):
     """Sanitize a filename to ensure it's safe for all operating systems"""
-    # Replace problematic characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, "_")
+    # Replace problematic characters in one pass
+    filename = filename.translate(_SANITIZE_TABLE)
 
     # Limit length (adjust if needed)
     if len(filename) > 255:
@@ -43,31 +46,66 @@ def sanitize_filename(filename):
     return filename
 
 
+# Cached (result, expiry) for the ExifTool availability probe; the check
+# runs as a dependency on every guarded request
+_EXIFTOOL_CACHE = None
+_EXIFTOOL_CACHE_TTL = 60.0
+
+
 def check_exiftool_available():
-    """Check if ExifTool is available in the system"""
-    try:
-        result = subprocess.run(
-            ["exiftool", "-ver"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=False,
-        )
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+    """Check if ExifTool is available in the system (cached for 60s)"""
+    global _EXIFTOOL_CACHE
+
+    now = time.monotonic()
+    if _EXIFTOOL_CACHE is not None and _EXIFTOOL_CACHE[1] > now:
+        return _EXIFTOOL_CACHE[0]
+
+    # A PATH walk via shutil.which is enough to know the binary exists;
+    # no need to fork an exiftool -ver process per request
+    available = shutil.which("exiftool") is not None
+    _EXIFTOOL_CACHE = (available, now + _EXIFTOOL_CACHE_TTL)
+    return available
+
+
+# Allowed extensions precompiled as frozensets for O(1) membership checks
+# on the per-file hot path (batch uploads call these once per file)
+_IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png", ".raf", ".tiff", ".tif"})
+_FUJI_EXTS = frozenset({".jpg", ".jpeg", ".raf"})
+
+
+# Magic-number prefixes for the supported formats, checked in one
+# startswith call against the first bytes of an upload
+_IMAGE_MAGIC_PREFIXES = (
+    b"\xff\xd8\xff",  # JPEG
+    b"\x89PNG\r\n\x1a\n",  # PNG
+    b"II*\x00",  # TIFF (little-endian)
+    b"MM\x00*",  # TIFF (big-endian)
+    b"FUJIFILM",  # RAF
+)
+
+
+def validate_image_magic(header):
+    """Validate that a file header matches a supported image format"""
+    return header.startswith(_IMAGE_MAGIC_PREFIXES)
 
 
 def validate_image_file(filename):
     """Validate if a file is an acceptable image format"""
-    allowed_extensions = (".jpg", ".jpeg", ".png", ".raf", ".tiff", ".tif")
-    return filename.lower().endswith(allowed_extensions)
+    # Slice off the extension first so only the suffix gets lowercased
+    dot = filename.rfind(".")
+    return dot != -1 and filename[dot:].lower() in _IMAGE_EXTS
 
 
 def validate_fuji_file(filename):
     """Validate if a file is a Fujifilm compatible format"""
-    allowed_extensions = (".jpg", ".jpeg", ".raf")
-    return filename.lower().endswith(allowed_extensions)
+    dot = filename.rfind(".")
+    return dot != -1 and filename[dot:].lower() in _FUJI_EXTS
+
+
+# Default upload limit, converted to bytes once at import time
+# Hardcoded to 50MB to ensure consistency
+_DEFAULT_MAX_SIZE_MB = 50.0
+_DEFAULT_MAX_SIZE_BYTES = int(_DEFAULT_MAX_SIZE_MB * 1024 * 1024)
 
 
 def validate_file_size(file, max_size_mb=None):
@@ -85,16 +123,21 @@ def validate_file_size(file, max_size_mb=None):
         HTTPException: If file size exceeds the maximum allowed size
     """
     if max_size_mb is None:
-        # Hardcoded to 50MB to ensure consistency
-        max_size_mb = 50.0
-
-    # Get file size in bytes
-    file.file.seek(0, os.SEEK_END)
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset file pointer for subsequent operations
-
-    # Convert MB to bytes
-    max_size_bytes = max_size_mb * 1024 * 1024
+        max_size_mb = _DEFAULT_MAX_SIZE_MB
+
+    # Prefer the size Starlette recorded while parsing the multipart body;
+    # seeking a spooled upload to the end forces it to materialize
+    file_size = getattr(file, "size", None)
+    if file_size is None:
+        file.file.seek(0, os.SEEK_END)
+        file_size = file.file.tell()
+        file.file.seek(0)  # Reset file pointer for subsequent operations
+
+    # Use the precomputed default; only convert for custom limits
+    if max_size_mb == _DEFAULT_MAX_SIZE_MB:
+        max_size_bytes = _DEFAULT_MAX_SIZE_BYTES
+    else:
+        max_size_bytes = max_size_mb * 1024 * 1024
 
     if file_size > max_size_bytes:
         raise HTTPException(
@@ -1,35 +1,69 @@
 """Main FastAPI application."""
+import asyncio
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 import os
 
-from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse, FileResponse, HTMLResponse, RedirectResponse
-from fastapi.middleware.cors import CORSMiddleware
+# Install uvloop as the event loop policy when available; the C event
+# loop roughly halves per-request loop overhead versus stock asyncio.
+# Run uvicorn with --loop uvloop --http httptools to match in deployment.
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+import orjson
+
+from fastapi import FastAPI, Request, HTTPException, Response
+from fastapi.responses import (
+    FileResponse,
+    HTMLResponse,
+    ORJSONResponse,
+    RedirectResponse,
+)
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 from fastapi.openapi.utils import get_openapi
 from fastapi.staticfiles import StaticFiles
-from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.datastructures import UploadFile
 
 from app.core.config import settings
-from app.models.exif import ErrorResponse
+from app.core.limiter import limiter
 from app.api.v1.router import api_router
 from app.api.health import router as health_router
-from app.core.utils import ensure_directory_exists
+from app.core.utils import check_exiftool_available, ensure_directory_exists
 from app.core.middleware import add_middleware
-
-# Configure logging
-logging.basicConfig(
-    level=settings.get_log_level(),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+from app.services.exif_service import EXIF_EXECUTOR, ExifService
+from app.services.exiftool_daemon import exiftool_daemon
+
+# Configure logging through a queue: the request coroutine only does a
+# non-blocking put, and a dedicated listener thread owns the actual
+# stream write so handler I/O never blocks the event loop
+_log_queue = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
-logger = logging.getLogger(__name__)
+_root_logger = logging.getLogger()
+_root_logger.setLevel(settings.get_log_level())
+_root_logger.handlers = [logging.handlers.QueueHandler(_log_queue)]
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _stream_handler, respect_handler_level=True
+)
+_log_listener.start()
 
-# Initialize rate limiter
-limiter = Limiter(key_func=lambda x: x.client.host)
+# Skip expensive thread/process/frame introspection per log record
+logging.logThreads = False
+logging.logProcesses = False
+logging._srcfile = None
+
+logger = logging.getLogger(__name__)
 
 # Calculate max file size in bytes
 max_file_size_bytes = int(settings.MAX_FILE_SIZE * 1024 * 1024)  # Convert MB to bytes
@@ -41,18 +75,11 @@ app = FastAPI(
     version=settings.VERSION,
     docs_url=None,  # We'll serve these manually for custom paths/styling
     redoc_url=None,
+    openapi_url=None,  # Served from pre-serialized bytes below
+    default_response_class=ORJSONResponse,
 )
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Add custom middleware
+# Add custom middleware (includes CORS handling in the security-header layer)
 add_middleware(app)
 
 # Add static files
@@ -69,12 +96,11 @@ async def root():
 # UI route
 @app.get("/ui", response_class=HTMLResponse, include_in_schema=False)
 async def ui():
-    """Serve the UI frontend."""
-    try:
-        with open("frontend/index.html", "r") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
+    """Serve the UI frontend from the bytes cached at startup."""
+    html = getattr(app.state, "ui_html", None)
+    if html is None:
         raise HTTPException(status_code=404, detail="UI not found")
+    return Response(content=html, media_type="text/html")
 
 
 # Add custom OpenAPI endpoints
@@ -82,7 +108,7 @@ async def ui():
 async def custom_swagger_ui_html():
     """Custom Swagger UI documentation."""
     return get_swagger_ui_html(
-        openapi_url=app.openapi_url,
+        openapi_url="/openapi.json",
         title=f"{settings.PROJECT_NAME} - Swagger UI",
         oauth2_redirect_url=app.swagger_ui_oauth2_redirect_url,
         swagger_js_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui-bundle.js",
@@ -94,7 +120,7 @@ async def custom_swagger_ui_html():
 async def redoc_html():
     """ReDoc documentation."""
     return get_redoc_html(
-        openapi_url=app.openapi_url,
+        openapi_url="/openapi.json",
         title=f"{settings.PROJECT_NAME} - ReDoc",
         redoc_js_url="https://cdn.jsdelivr.net/npm/redoc@next/bundles/redoc.standalone.js",
     )
@@ -125,6 +151,16 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
+
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_json():
+    """Serve the OpenAPI schema as bytes serialized once and cached."""
+    cached = getattr(app.state, "openapi_json", None)
+    if cached is None:
+        cached = orjson.dumps(custom_openapi())
+        app.state.openapi_json = cached
+    return Response(content=cached, media_type="application/json")
+
 # Add rate limiter to application
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
@@ -133,8 +169,8 @@ app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 app.include_router(health_router)
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
-# Create a temporary directory for uploaded files
-ensure_directory_exists(settings.TEMP_DIR)
+# Constant 500 payload so the handler doesn't rebuild it per error
+_UNEXPECTED_ERROR = {"detail": "An unexpected error occurred"}
 
 
 # Handle HTTP exceptions
@@ -143,9 +179,9 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     """
     Custom handler for HTTP exceptions to standardize error responses.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=ErrorResponse(detail=str(exc.detail)).dict(),
+        content={"detail": str(exc.detail)},
     )
 
 
@@ -156,10 +192,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     Custom handler for general exceptions to standardize error responses.
     """
     logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
-        status_code=500,
-        content=ErrorResponse(detail="An unexpected error occurred").dict(),
-    )
+    return ORJSONResponse(status_code=500, content=_UNEXPECTED_ERROR)
 
 
 # Startup event to verify settings
@@ -168,6 +201,13 @@ async def startup_event():
     """Log application startup and verify settings."""
     logger.info("Starting EXIF Checker API")
 
+    # Cache the UI page in memory so /ui doesn't re-read it per request
+    try:
+        app.state.ui_html = Path("frontend/index.html").read_bytes()
+    except FileNotFoundError:
+        app.state.ui_html = None
+        logger.warning("frontend/index.html not found; /ui will return 404")
+
     # Log the MAX_FILE_SIZE setting to verify it's correctly loaded
     logger.info(f"MAX_FILE_SIZE setting: {settings.MAX_FILE_SIZE} MB")
     logger.info(f"Maximum upload size: {max_file_size_bytes} bytes")
@@ -176,6 +216,19 @@ async def startup_event():
     ensure_directory_exists(settings.TEMP_DIR)
     logger.info(f"Temporary directory set up at {settings.TEMP_DIR}")
 
+    # Background sweep of leaked temp files so the directory can't grow
+    # without bound between restarts
+    app.state.temp_sweeper = asyncio.create_task(ExifService.sweep_temp_files_forever())
+
+    # Start the persistent exiftool daemon so requests reuse one warm process
+    if check_exiftool_available():
+        try:
+            exiftool_daemon.start()
+        except OSError as e:
+            logger.warning(f"Could not start exiftool daemon: {str(e)}")
+    else:
+        logger.warning("ExifTool not found; daemon not started")
+
 
 # Shutdown event
 @app.on_event("shutdown")
@@ -183,13 +236,31 @@ def cleanup():
     """Clean up resources."""
     logger.info("Cleaning up resources")
 
-    # Clean up temporary files
+    # Stop the background temp-file sweeper
+    sweeper = getattr(app.state, "temp_sweeper", None)
+    if sweeper is not None:
+        sweeper.cancel()
+
+    # Shut down the exiftool daemon and its executor
+    exiftool_daemon.stop()
+    EXIF_EXECUTOR.shutdown(wait=False)
+
+    # Clean up temporary files; scandir caches the file type from the
+    # directory read, so this is one getdents pass instead of a stat per
+    # entry via pathlib
     try:
-        temp_dir = settings.TEMP_DIR
-        if temp_dir.exists():
-            for file in temp_dir.glob("*"):
-                if file.is_file():
-                    file.unlink()
+        with os.scandir(settings.TEMP_DIR) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
         logger.info("Temporary files cleaned up")
+    except FileNotFoundError:
+        pass
     except Exception as e:
         logger.error(f"Error cleaning up: {str(e)}")
+
+    # Flush and stop the logging listener thread last
+    _log_listener.stop()
@@ -1,11 +1,23 @@
 """EXIF data models."""
-from pydantic import BaseModel, Field
+import sys
+
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, Any, List, Optional
 
+# Shared config: ignore unknown keys instead of validating them and skip
+# the attribute-based construction path the API never uses
+_MODEL_CONFIG = ConfigDict(extra="ignore", from_attributes=False)
+
+# Single interned "Unknown" shared by every defaulted field, so default
+# construction references one object and callers can compare with `is`
+_UNKNOWN = sys.intern("Unknown")
+
 
 class ExifResponse(BaseModel):
     """Model for EXIF data response"""
 
+    model_config = _MODEL_CONFIG
+
     filename: str
     metadata: Dict[str, Any]
 
@@ -13,38 +25,44 @@ class ExifResponse(BaseModel):
 class RecipeDetails(BaseModel):
     """Model for Fujifilm recipe details"""
 
-    FilmSimulation: str = Field(default="Unknown")
-    DynamicRange: str = Field(default="Unknown")
-    GrainEffect: str = Field(default="Unknown")
-    ColorChrome: str = Field(default="Unknown")
-    ColorChromeBlue: str = Field(default="Unknown")
-    WhiteBalance: str = Field(default="Unknown")
-    WBShift: str = Field(default="Unknown")
-    Highlights: str = Field(default="Unknown")
-    Shadows: str = Field(default="Unknown")
-    Color: str = Field(default="Unknown")
-    Sharpness: str = Field(default="Unknown")
-    NoiseReduction: str = Field(default="Unknown")
+    model_config = _MODEL_CONFIG
+
+    FilmSimulation: str = Field(default=_UNKNOWN)
+    DynamicRange: str = Field(default=_UNKNOWN)
+    GrainEffect: str = Field(default=_UNKNOWN)
+    ColorChrome: str = Field(default=_UNKNOWN)
+    ColorChromeBlue: str = Field(default=_UNKNOWN)
+    WhiteBalance: str = Field(default=_UNKNOWN)
+    WBShift: str = Field(default=_UNKNOWN)
+    Highlights: str = Field(default=_UNKNOWN)
+    Shadows: str = Field(default=_UNKNOWN)
+    Color: str = Field(default=_UNKNOWN)
+    Sharpness: str = Field(default=_UNKNOWN)
+    NoiseReduction: str = Field(default=_UNKNOWN)
 
 
 class FujiRecipeResponse(BaseModel):
     """Model for Fujifilm recipe response"""
 
+    model_config = _MODEL_CONFIG
+
     filename: str
     recipe: str
     recipe_details: RecipeDetails
     date: str = Field(default="Unknown Date")
     camera_model: str = Field(default="Unknown Camera")
     lens_model: str = Field(default="Unknown Lens")
-    aperture: str = Field(default="Unknown")
-    shutter_speed: str = Field(default="Unknown")
-    iso: str = Field(default="Unknown")
-    focal_length: str = Field(default="Unknown")
+    aperture: str = Field(default=_UNKNOWN)
+    shutter_speed: str = Field(default=_UNKNOWN)
+    iso: str = Field(default=_UNKNOWN)
+    focal_length: str = Field(default=_UNKNOWN)
 
 
 class BatchExifResponse(BaseModel):
     """Model for batch processing response"""
 
+    model_config = _MODEL_CONFIG
+
     results: List[ExifResponse]
     errors: List[Dict[str, str]] = Field(default_factory=list)
 
@@ -52,4 +70,6 @@ class BatchExifResponse(BaseModel):
 class ErrorResponse(BaseModel):
     """Model for error responses"""
 
+    model_config = _MODEL_CONFIG
+
     detail: str
@@ -1,10 +1,19 @@
 """Service for EXIF data operations."""
-import json
+import asyncio
+import hashlib
 import subprocess
 import os
-import shutil
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from queue import Empty, SimpleQueue
+from threading import Lock
+import orjson
 from fastapi import HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
 import logging
 
 from app.core.utils import (
@@ -12,26 +21,514 @@ from app.core.utils import (
     validate_image_file,
     validate_fuji_file,
     validate_file_size,
+    validate_image_magic,
     format_date_for_filename,
     sanitize_filename,
 )
 from app.core.config import settings
-from app.models.exif import FujiRecipeResponse, RecipeDetails
+from app.models.exif import FujiRecipeResponse, RecipeDetails, _UNKNOWN
+from app.services.exiftool_daemon import ExifToolDaemonError, exiftool_daemon
+
+# Optional in-process metadata reader. When pyexiv2 (libexiv2 bindings)
+# is installed, the fixed Fuji tag set is read at library speed with no
+# process spawn; exiftool remains the fallback for everything else.
+try:
+    import pyexiv2
+except ImportError:
+    pyexiv2 = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# exiv2 tag keys mapped to the exiftool-style names the response builder
+# reads; precomputed so the in-process path is one dict pass
+_PYEXIV2_TAG_MAP = {
+    "Exif.Fujifilm.FilmMode": "FilmMode",
+    "Exif.Fujifilm.DynamicRange": "DynamicRange",
+    "Exif.Fujifilm.GrainEffectRoughness": "GrainEffectRoughness",
+    "Exif.Fujifilm.ColorChromeEffect": "ColorChrome",
+    "Exif.Fujifilm.ColorChromeFxBlue": "ColorChromeBlue",
+    "Exif.Fujifilm.WhiteBalance": "WhiteBalance",
+    "Exif.Fujifilm.WhiteBalanceFineTune": "WhiteBalanceFineTune",
+    "Exif.Fujifilm.HighlightTone": "HighlightTone",
+    "Exif.Fujifilm.ShadowTone": "ShadowTone",
+    "Exif.Fujifilm.Saturation": "Saturation",
+    "Exif.Fujifilm.Sharpness": "Sharpness",
+    "Exif.Fujifilm.NoiseReduction": "NoiseReduction",
+    "Exif.Photo.DateTimeOriginal": "DateTimeOriginal",
+    "Exif.Image.Model": "Model",
+    "Exif.Photo.LensModel": "LensModel",
+    "Exif.Photo.FNumber": "Aperture",
+    "Exif.Photo.ExposureTime": "ShutterSpeed",
+    "Exif.Photo.ISOSpeedRatings": "ISO",
+    "Exif.Photo.FocalLength": "FocalLength",
+}
+
+# exiv2 hands back raw exif values (rationals like "4/1", numeric maker
+# note codes), not exiftool's PrintConv'd strings, so the in-process
+# path must normalize before substituting for exiftool output. These
+# tables mirror exiftool's Fujifilm PrintConv; an unmapped code aborts
+# the in-process read and the request falls back to exiftool rather
+# than returning a different-looking response.
+_EXIV2_STRENGTH = {0x0: "Off", 0x10: "Weak", 0x20: "Strong"}
+_EXIV2_TONE = {
+    -64: "+4 (hardest)",
+    -48: "+3 (very hard)",
+    -32: "+2 (hard)",
+    -16: "+1 (medium hard)",
+    0: "0 (normal)",
+    16: "-1 (medium soft)",
+    32: "-2 (soft)",
+}
+_EXIV2_CODE_TABLES = {
+    "FilmMode": {
+        0x000: "F0/Standard (Provia)",
+        0x100: "F1/Studio Portrait",
+        0x110: "F1a/Studio Portrait Enhanced Saturation",
+        0x120: "F1b/Studio Portrait Smooth Skin Tone (Astia)",
+        0x130: "F1c/Studio Portrait Increased Sharpness",
+        0x200: "F2/Fujichrome (Velvia)",
+        0x300: "F3/Studio Portrait Ex",
+        0x400: "F4/Velvia",
+        0x500: "Pro Neg. Std",
+        0x501: "Pro Neg. Hi",
+        0x600: "Classic Chrome",
+        0x700: "Eterna",
+        0x800: "Classic Negative",
+        0x900: "Bleach Bypass",
+        0xA00: "Nostalgic Neg",
+        0xB00: "Reala ACE",
+    },
+    "DynamicRange": {0x1: "Standard", 0x3: "Wide"},
+    "GrainEffectRoughness": _EXIV2_STRENGTH,
+    "ColorChrome": _EXIV2_STRENGTH,
+    "ColorChromeBlue": _EXIV2_STRENGTH,
+    "WhiteBalance": {
+        0x000: "Auto",
+        0x001: "Auto (white priority)",
+        0x002: "Auto (ambiance priority)",
+        0x100: "Daylight",
+        0x200: "Cloudy",
+        0x300: "Daylight Fluorescent",
+        0x301: "Day White Fluorescent",
+        0x302: "White Fluorescent",
+        0x303: "Warm White Fluorescent",
+        0x304: "Living Room Warm White Fluorescent",
+        0x400: "Incandescent",
+        0x500: "Flash",
+        0x600: "Underwater",
+        0xF00: "Custom",
+        0xF01: "Custom2",
+        0xF02: "Custom3",
+        0xF03: "Custom4",
+        0xF04: "Custom5",
+        0xFF0: "Kelvin",
+    },
+    "HighlightTone": _EXIV2_TONE,
+    "ShadowTone": _EXIV2_TONE,
+    "Saturation": {
+        0x000: "Normal",
+        0x080: "Medium High",
+        0x100: "High",
+        0x180: "Medium Low",
+        0x200: "Low",
+        0x300: "None (B&W)",
+        0x301: "B&W Red Filter",
+        0x302: "B&W Yellow Filter",
+        0x303: "B&W Green Filter",
+        0x310: "B&W Sepia",
+        0x400: "Low 2",
+        0x500: "Acros",
+        0x501: "Acros Red Filter",
+        0x502: "Acros Yellow Filter",
+        0x503: "Acros Green Filter",
+        0x8000: "Film Simulation",
+    },
+    "Sharpness": {
+        0x01: "Soft",
+        0x02: "Soft2",
+        0x03: "Normal",
+        0x04: "Hard",
+        0x05: "Hard2",
+        0x82: "Medium Soft",
+        0x84: "Medium Hard",
+        0x8000: "Film Simulation",
+        0xFFFF: "n/a",
+    },
+    "NoiseReduction": {0x40: "Low", 0x80: "Normal", 0x100: "n/a"},
+}
+
+
+def _exiv2_rational(value):
+    """Convert an exiv2 rational string like "350/10" to a float."""
+    num, _, den = str(value).partition("/")
+    return int(num) / int(den or 1)
+
+
+def _exiv2_shutter_speed(value):
+    """Format an exposure time the way exiftool prints ShutterSpeed."""
+    secs = _exiv2_rational(value)
+    if 0 < secs <= 0.25001:
+        return f"1/{int(0.5 + 1 / secs)}"
+    text = f"{secs:.1f}"
+    return text[:-2] if text.endswith(".0") else text
+
+
+def _exiv2_wb_fine_tune(value):
+    """Format a raw "red blue" shift pair like exiftool (units of 20)."""
+    red, blue = (int(v) for v in str(value).split())
+    return f"Red {int(red / 20):+d}, Blue {int(blue / 20):+d}"
+
+
+# Per-field converters for the non-coded tags; fields absent here pass
+# through unchanged (plain strings that already match exiftool output)
+_EXIV2_VALUE_CONV = {
+    "Aperture": lambda v: round(_exiv2_rational(v), 1),
+    "ShutterSpeed": _exiv2_shutter_speed,
+    "FocalLength": lambda v: f"{_exiv2_rational(v):.1f} mm",
+    "ISO": int,
+    "WhiteBalanceFineTune": _exiv2_wb_fine_tune,
+}
+
+# Chunk/buffer size for streaming uploads to disk (1 MiB). Large buffers
+# keep the copy memory-bandwidth-bound instead of syscall-bound.
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Pool of reusable copy buffers checked out per upload, so the write
+# loop allocates no per-chunk bytes objects; overflow demand simply
+# allocates a fresh buffer that joins the pool when returned
+_BUF_POOL_SIZE = 4
+_buf_pool = SimpleQueue()
+for _ in range(_BUF_POOL_SIZE):
+    _buf_pool.put(bytearray(UPLOAD_CHUNK_SIZE))
+
+# Batches larger than this pass their paths via -@ argfile rather than
+# argv, keeping one-shot invocations clear of ARG_MAX
+_ARGFILE_THRESHOLD = 100
+
+# Tag filter for the Fuji path: exiftool formats time proportional to
+# the tags requested, so asking for just these cuts its CPU and JSON
+# size on RAFs carrying hundreds of MakerNote tags
+_FUJI_CLI_TAGS = (
+    "-FilmMode",
+    "-FilmSimulation",
+    "-DynamicRange",
+    "-GrainEffectRoughness",
+    "-GrainEffect",
+    "-ColorChrome",
+    "-ColorChromeEffect",
+    "-ColorChromeBlue",
+    "-ColorChromeFXBlue",
+    "-WhiteBalance",
+    "-WhiteBalanceFineTune",
+    "-HighlightTone",
+    "-ShadowTone",
+    "-Saturation",
+    "-Sharpness",
+    "-NoiseReduction",
+    "-Aperture",
+    "-ISO",
+    "-FocalLength",
+    "-ShutterSpeed",
+    "-DateTimeOriginal",
+    "-Model",
+    "-LensModel",
+)
+
+# RecipeDetails fields mapped to their candidate metadata tag names, in
+# priority order; the response builder walks this table once per image
+_FUJI_MAP = (
+    ("FilmSimulation", ("FilmMode", "FilmSimulation")),
+    ("DynamicRange", ("DynamicRange",)),
+    ("GrainEffect", ("GrainEffectRoughness", "GrainEffect")),
+    ("ColorChrome", ("ColorChrome", "ColorChromeEffect")),
+    ("ColorChromeBlue", ("ColorChromeBlue", "ColorChromeFXBlue")),
+    ("WhiteBalance", ("WhiteBalance",)),
+    ("WBShift", ("WhiteBalanceFineTune",)),
+    ("Highlights", ("HighlightTone",)),
+    ("Shadows", ("ShadowTone",)),
+    ("Color", ("Saturation",)),
+    ("Sharpness", ("Sharpness",)),
+    ("NoiseReduction", ("NoiseReduction",)),
+)
+
+# Dedicated executor for exiftool work, sized to the CPUs. The work is
+# dominated by waiting on the child process (the GIL is released), so
+# threads scale fine here and the daemon pool's pipes stay usable —
+# they could not cross a process boundary. Keeping exiftool off the
+# default loop executor also stops parse bursts from starving other
+# offloaded work.
+EXIF_EXECUTOR = ThreadPoolExecutor(
+    max_workers=(os.cpu_count() or 2) * 2, thread_name_prefix="exif"
+)
+
+# Bound on how many requests may run the EXIF pipeline concurrently
+# within one worker. Tune alongside EXIFTOOL_POOL_SIZE and the executor
+# above: more permits than daemon workers just queues on the pool, while
+# unbounded fan-out risks exhausting file descriptors on large batches.
+_EXIF_SEM = asyncio.Semaphore(int(os.getenv("EXIF_CONCURRENCY", "8")))
+
+# Background sweep cadence and the age past which a temp file is
+# considered leaked (requests normally delete their own files)
+_SWEEP_INTERVAL = 300.0
+_SWEEP_MAX_AGE = 3600.0
+
+# Whether os.sendfile can target a pipe (Linux only); used to move rolled
+# upload spools into exiftool's stdin without a user-space bounce buffer
+_SENDFILE_TO_PIPE = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+
+# Whether the destination extent can be preallocated before writing
+_HAS_FALLOCATE = hasattr(os, "posix_fallocate")
+
+# LRU cache of parsed metadata keyed by content hash, so repeat uploads of
+# the same image skip the exiftool subprocess entirely. Cached dicts are
+# shared between requests and must not be mutated by callers.
+_EXIF_CACHE_MAX = 1024
+_exif_cache: "OrderedDict[bytes, dict]" = OrderedDict()
+_exif_cache_lock = Lock()
+
+
+def _exif_cache_get(digest):
+    """Look up a cached metadata dict by content digest."""
+    with _exif_cache_lock:
+        metadata = _exif_cache.get(digest)
+        if metadata is not None:
+            _exif_cache.move_to_end(digest)
+        return metadata
+
+
+def _exif_cache_put(digest, metadata):
+    """Store a metadata dict under its content digest, evicting the LRU entry."""
+    with _exif_cache_lock:
+        _exif_cache[digest] = metadata
+        if len(_exif_cache) > _EXIF_CACHE_MAX:
+            _exif_cache.popitem(last=False)
+
+
+def _digest_upload_sync(src):
+    """
+    Hash an upload's spool file content in streaming chunks.
+
+    Leaves the file position at the start so the caller can go on to
+    save or read the upload.
+
+    Args:
+        src: The upload's underlying file object
+
+    Returns:
+        bytes: SHA-256 digest of the content
+    """
+    h = hashlib.sha256()
+    src.seek(0)
+    while chunk := src.read(UPLOAD_CHUNK_SIZE):
+        h.update(chunk)
+    src.seek(0)
+    return h.digest()
+
+
+# Companion LRU for path-based parsing, keyed by (absolute path,
+# st_mtime_ns, st_size) so a changed or replaced file misses naturally.
+# Repeat reads of the same on-disk file skip exiftool entirely.
+_path_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+_path_cache_lock = Lock()
+
+
+def _path_cache_key(file_path):
+    """Build a cache key for a file, or None if it cannot be stated."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+
+
+def _path_cache_get(key):
+    """Look up a cached metadata dict by its stat key."""
+    with _path_cache_lock:
+        metadata = _path_cache.get(key)
+        if metadata is not None:
+            _path_cache.move_to_end(key)
+        return metadata
+
+
+def _path_cache_put(key, metadata):
+    """Store a metadata dict under its stat key, evicting the LRU entry."""
+    with _path_cache_lock:
+        _path_cache[key] = metadata
+        if len(_path_cache) > _EXIF_CACHE_MAX:
+            _path_cache.popitem(last=False)
+
 
 class ExifService:
     """Service for handling EXIF operations."""
 
     @staticmethod
-    def parse_exif_metadata(file_path):
+    async def parse_exif_metadata(file_path, tags=(), use_cache=True):
         """
         Parse EXIF metadata from image file using exiftool.
 
+        Runs without blocking the event loop: daemon commands go through
+        the threadpool (the protocol is blocking pipe I/O), and the
+        fallback spawns exiftool via asyncio so other requests progress
+        while this one waits.
+
         Args:
             file_path: Path to the image file
+            tags: Optional -TAG arguments restricting exiftool's output
+            use_cache: Consult and fill the stat-keyed path cache. Pass
+                False for single-use temp files, whose unique name and
+                fresh mtime make the key unrepeatable — caching those
+                would only stat and retain unreachable entries
+
+        Returns:
+            dict: Parsed EXIF metadata
+
+        Raises:
+            HTTPException: If there's an error processing the image
+        """
+        # Short-circuit repeat reads of an unchanged file; cached dicts
+        # are shared between requests and must not be mutated by callers
+        cache_key = _path_cache_key(file_path) if use_cache else None
+        if cache_key is not None:
+            cache_key = (cache_key, tags)
+            metadata = _path_cache_get(cache_key)
+            if metadata is not None:
+                return metadata
+
+        # Prefer the warm stay_open daemon over a fresh process; one Perl
+        # interpreter startup amortized over the server lifetime
+        if exiftool_daemon.is_running:
+            try:
+                loop = asyncio.get_running_loop()
+                metadata_list = await loop.run_in_executor(
+                    EXIF_EXECUTOR,
+                    exiftool_daemon.execute_json,
+                    "-j",
+                    *tags,
+                    os.fspath(file_path),
+                )
+                metadata = metadata_list[0] if metadata_list else {}
+                if cache_key is not None:
+                    _path_cache_put(cache_key, metadata)
+                return metadata
+            except ExifToolDaemonError as e:
+                logger.warning(f"exiftool daemon failed, falling back: {str(e)}")
+
+        try:
+            # Spawn exiftool through asyncio and await its output
+            proc = await asyncio.create_subprocess_exec(
+                "exiftool",
+                "-j",
+                *tags,
+                os.fspath(file_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, _ = await proc.communicate()
+            if proc.returncode != 0:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Error processing image: exiftool exited with {proc.returncode}",
+                )
+
+            # Parse the JSON output
+            metadata_list = orjson.loads(stdout)
+            metadata = metadata_list[0] if metadata_list else {}
+
+            if cache_key is not None:
+                _path_cache_put(cache_key, metadata)
+            return metadata
+        except OSError as e:
+            logger.error(f"Error processing image: {str(e)}")
+            raise HTTPException(
+                status_code=500, detail=f"Error processing image: {str(e)}"
+            )
+        except orjson.JSONDecodeError:
+            logger.error("Error parsing EXIF data")
+            raise HTTPException(status_code=500, detail="Error parsing EXIF data")
+
+    @staticmethod
+    def parse_exif_metadata_many(paths):
+        """
+        Parse EXIF metadata for several files with one exiftool invocation.
+
+        ExifTool accepts a list of paths and emits a single JSON array,
+        so a whole batch costs one process spawn instead of one per file.
+
+        Args:
+            paths: List of paths to image files
+
+        Returns:
+            dict: Mapping of source path (as passed) to its metadata dict;
+                files exiftool could not read are absent
+
+        Raises:
+            HTTPException: If exiftool produces no usable output
+        """
+        if not paths:
+            return {}
+
+        args = [os.fspath(p) for p in paths]
+
+        # Prefer the warm daemon; fall back to a one-shot process. The
+        # daemon takes its arguments over stdin, so batch size is not
+        # limited by ARG_MAX there.
+        if exiftool_daemon.is_running:
+            try:
+                metadata_list = exiftool_daemon.execute_json("-j", *args)
+                return {m.get("SourceFile"): m for m in metadata_list}
+            except ExifToolDaemonError as e:
+                logger.warning(f"exiftool daemon failed, falling back: {str(e)}")
+
+        # Large batches go through -@ argfile so the command line stays
+        # clear of ARG_MAX regardless of batch size
+        argfile_path = None
+        if len(args) > _ARGFILE_THRESHOLD:
+            fd, argfile_path = tempfile.mkstemp(
+                suffix=".args", dir=settings.TEMP_DIR
+            )
+            with os.fdopen(fd, "w") as argfile:
+                argfile.write("\n".join(args))
+            command = ["exiftool", "-j", "-@", argfile_path]
+        else:
+            command = ["exiftool", "-j", *args]
+
+        try:
+            # exiftool exits non-zero when any file fails but still emits
+            # JSON for the readable ones, so don't use check=True here
+            result = subprocess.run(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            if not result.stdout.strip():
+                raise HTTPException(
+                    status_code=500, detail="Error processing batch images"
+                )
+
+            metadata_list = orjson.loads(result.stdout)
+            return {m.get("SourceFile"): m for m in metadata_list}
+        except orjson.JSONDecodeError:
+            logger.error("Error parsing EXIF data")
+            raise HTTPException(status_code=500, detail="Error parsing EXIF data")
+        finally:
+            if argfile_path is not None:
+                try:
+                    os.unlink(argfile_path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def parse_exif_metadata_from_bytes(data, tags=()):
+        """
+        Parse EXIF metadata from in-memory image data using exiftool.
+
+        Feeds the bytes to exiftool via stdin so no temporary file is
+        needed.
+
+        Args:
+            data: Raw image bytes
+            tags: Optional -TAG arguments restricting exiftool's output
 
         Returns:
             dict: Parsed EXIF metadata
@@ -39,32 +536,246 @@ class ExifService:
         Raises:
             HTTPException: If there's an error processing the image
         """
+        # Short-circuit repeat uploads of identical content
+        digest = (hashlib.sha256(data).digest(), tags)
+        metadata = _exif_cache_get(digest)
+        if metadata is not None:
+            return metadata
+
         try:
-            # Use subprocess to call exiftool and capture the output
+            # Read from stdin with -fast so exiftool doesn't need a seekable file
             result = subprocess.run(
-                ["exiftool", "-j", file_path],
+                ["exiftool", "-fast", "-j", *tags, "-"],
+                input=data,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
                 check=True,
             )
 
             # Parse the JSON output
-            metadata_list = json.loads(result.stdout)
+            metadata_list = orjson.loads(result.stdout)
             metadata = metadata_list[0] if metadata_list else {}
 
+            _exif_cache_put(digest, metadata)
             return metadata
         except subprocess.CalledProcessError as e:
             logger.error(f"Error processing image: {str(e)}")
             raise HTTPException(
                 status_code=500, detail=f"Error processing image: {str(e)}"
             )
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
+            logger.error("Error parsing EXIF data")
+            raise HTTPException(status_code=500, detail="Error parsing EXIF data")
+
+    @staticmethod
+    def parse_exif_metadata_from_upload(file: UploadFile, tags=()) -> dict:
+        """
+        Parse EXIF metadata from an upload spooled to disk via sendfile.
+
+        Moves the bytes from the spool file descriptor straight into
+        exiftool's stdin in-kernel, skipping both the user-space bounce
+        buffer and a second disk write.
+
+        Args:
+            file: An upload whose SpooledTemporaryFile has rolled to disk
+            tags: Optional -TAG arguments restricting exiftool's output
+
+        Returns:
+            dict: Parsed EXIF metadata
+
+        Raises:
+            HTTPException: If there's an error processing the image
+        """
+        src_fd = file.file.fileno()
+        size = file.size or os.fstat(src_fd).st_size
+
+        proc = subprocess.Popen(
+            ["exiftool", "-fast", "-j", *tags, "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(
+                    proc.stdin.fileno(), src_fd, offset, min(1 << 22, size - offset)
+                )
+                if sent == 0:
+                    break
+                offset += sent
+            proc.stdin.close()
+
+            stdout = proc.stdout.read()
+            if proc.wait() != 0:
+                raise subprocess.CalledProcessError(proc.returncode, "exiftool")
+
+            metadata_list = orjson.loads(stdout)
+            return metadata_list[0] if metadata_list else {}
+        except (OSError, subprocess.CalledProcessError) as e:
+            proc.kill()
+            logger.error(f"Error processing image: {str(e)}")
+            raise HTTPException(
+                status_code=500, detail=f"Error processing image: {str(e)}"
+            )
+        except orjson.JSONDecodeError:
             logger.error("Error parsing EXIF data")
             raise HTTPException(status_code=500, detail="Error parsing EXIF data")
 
+    @classmethod
+    async def extract_metadata(cls, file: UploadFile, tags=()) -> dict:
+        """
+        Extract EXIF metadata from an uploaded file.
+
+        While the stay_open daemon pool is up, every upload is written to
+        the temp dir (tmpfs on Linux, so no disk I/O) and parsed through
+        it — a warm worker beats cold-spawning a fresh Perl interpreter
+        per request. RAF files always take this path because exiftool
+        needs a seekable file to fully parse them. The stdin-pipe
+        fallbacks below only serve requests when the daemon is down.
+
+        Args:
+            file: The uploaded file
+            tags: Optional -TAG arguments restricting exiftool's output
+
+        Returns:
+            dict: Parsed EXIF metadata
+        """
+        # The semaphore caps concurrent pipeline runs per worker; waiting
+        # requests park on the event loop instead of piling subprocesses
+        # and open spool fds on top of each other
+        async with _EXIF_SEM:
+            is_raf = bool(file.filename) and file.filename.lower().endswith(".raf")
+            if is_raf or exiftool_daemon.is_running:
+                # Repeat uploads of identical content skip the save and
+                # the parse entirely; hashing runs in the threadpool so
+                # large spools don't block the loop
+                digest = (
+                    await run_in_threadpool(_digest_upload_sync, file.file),
+                    tags,
+                )
+                metadata = _exif_cache_get(digest)
+                if metadata is not None:
+                    return metadata
+
+                temp_file_path = await cls.save_upload_file(file)
+                try:
+                    # The temp file is single-use, so the path cache
+                    # could never hit on it
+                    metadata = await cls.parse_exif_metadata(
+                        temp_file_path, tags=tags, use_cache=False
+                    )
+                    _exif_cache_put(digest, metadata)
+                    return metadata
+                finally:
+                    if temp_file_path.exists():
+                        temp_file_path.unlink()
+
+            # Daemon unavailable: cold-spawn exiftool on a pipe. Large
+            # uploads that rolled to a real temp file can be spliced
+            # in-kernel into exiftool; small in-memory spools go through the
+            # bytes path, which also gets the content-hash cache. Both run
+            # on the exiftool executor — they block on pipe I/O and the
+            # subprocess wait, which must not stall the event loop.
+            loop = asyncio.get_running_loop()
+            if _SENDFILE_TO_PIPE and getattr(file.file, "_rolled", False):
+                return await loop.run_in_executor(
+                    EXIF_EXECUTOR, cls.parse_exif_metadata_from_upload, file, tags
+                )
+
+            data = await file.read()
+            return await loop.run_in_executor(
+                EXIF_EXECUTOR, cls.parse_exif_metadata_from_bytes, data, tags
+            )
+
+    @classmethod
+    async def extract_fuji_metadata(cls, file: UploadFile) -> FujiRecipeResponse:
+        """
+        Extract Fujifilm recipe data from an uploaded file.
+
+        Args:
+            file: The uploaded file
+
+        Returns:
+            FujiRecipeResponse: Parsed Fujifilm recipe data
+        """
+        # JPEGs can be read in-process when pyexiv2 is installed; RAFs
+        # and anything pyexiv2 can't handle fall through to exiftool
+        if pyexiv2 is not None and not file.filename.lower().endswith(".raf"):
+            data = await file.read()
+            try:
+                # Held only around the threadpool hop; the exiftool
+                # fallback below re-acquires inside extract_metadata
+                async with _EXIF_SEM:
+                    metadata = await run_in_threadpool(
+                        cls._read_fuji_tags_inprocess, data
+                    )
+            except Exception as e:
+                logger.warning(f"pyexiv2 read failed, falling back: {str(e)}")
+                metadata = None
+            if metadata:
+                return cls._build_fuji_response(metadata, file.filename)
+            # Rewind so the exiftool path re-reads the upload from the start
+            await file.seek(0)
+
+        metadata = await cls.extract_metadata(file, tags=_FUJI_CLI_TAGS)
+        return cls._build_fuji_response(metadata, file.filename)
+
+    @staticmethod
+    def _read_fuji_tags_inprocess(data):
+        """
+        Read the fixed Fuji tag set from image bytes via pyexiv2.
+
+        Raw exiv2 values are normalized to exiftool's representations so
+        the response is identical whichever backend served it.
+
+        Args:
+            data: Raw image bytes
+
+        Returns:
+            dict: Metadata under exiftool-style key names with
+                exiftool-style values; empty if the image carries none
+                of the mapped tags
+
+        Raises:
+            ValueError: If a present tag carries a code the conversion
+                tables don't cover (the caller falls back to exiftool)
+        """
+        img = pyexiv2.ImageData(data)
+        try:
+            exif = img.read_exif()
+        finally:
+            img.close()
+
+        metadata = {}
+        for src, dst in _PYEXIV2_TAG_MAP.items():
+            value = exif.get(src)
+            if value is None:
+                continue
+
+            # Coded maker-note values go through the PrintConv tables so
+            # the result matches exiftool's strings exactly
+            table = _EXIV2_CODE_TABLES.get(dst)
+            if table is not None:
+                code = int(value)
+                converted = table.get(code)
+                if converted is None:
+                    # The same code may arrive signed or unsigned
+                    # depending on how exiv2 typed the field
+                    converted = table.get(
+                        code - 0x10000 if code > 0x7FFF else code + 0x10000
+                    )
+                if converted is None:
+                    raise ValueError(f"unmapped {dst} code {value!r}")
+                metadata[dst] = converted
+                continue
+
+            conv = _EXIV2_VALUE_CONV.get(dst)
+            metadata[dst] = conv(value) if conv is not None else value
+        return metadata
+
     @staticmethod
-    def parse_fuji_metadata(file_path):
+    async def parse_fuji_metadata(file_path):
         """
         Parse Fujifilm specific metadata from image file.
 
@@ -74,68 +785,80 @@ class ExifService:
         Returns:
             dict: Parsed Fujifilm metadata
         """
-        metadata = ExifService.parse_exif_metadata(file_path)
+        # One Path view up front: .name below is a pure string split, so
+        # there is no separate basename parse of the same path
+        file_path = Path(file_path)
+        metadata = await ExifService.parse_exif_metadata(file_path)
+        return ExifService._build_fuji_response(metadata, file_path.name)
 
-        # Extract Fujifilm recipe components
-        film_simulation = metadata.get(
-            "FilmMode", metadata.get("FilmSimulation", "Unknown")
-        )
+    @staticmethod
+    def _build_fuji_response(metadata, filename):
+        """
+        Build a FujiRecipeResponse from parsed EXIF metadata.
 
-        # Build comprehensive recipe information
-        recipe_info = RecipeDetails(
-            FilmSimulation=metadata.get(
-                "FilmMode", metadata.get("FilmSimulation", "Unknown")
-            ),
-            DynamicRange=metadata.get("DynamicRange", "Unknown"),
-            GrainEffect=metadata.get("GrainEffectRoughness", "Unknown"),
-            ColorChrome=metadata.get("ColorChrome", "Unknown"),
-            ColorChromeBlue=metadata.get("ColorChromeBlue", "Unknown"),
-            WhiteBalance=metadata.get("WhiteBalance", "Unknown"),
-            WBShift=metadata.get("WhiteBalanceFineTune", "Unknown"),
-            Highlights=metadata.get("HighlightTone", "Unknown"),
-            Shadows=metadata.get("ShadowTone", "Unknown"),
-            Color=metadata.get("Saturation", "Unknown"),
-            Sharpness=metadata.get("Sharpness", "Unknown"),
-            NoiseReduction=metadata.get("NoiseReduction", "Unknown"),
-        )
+        Args:
+            metadata: Parsed EXIF metadata
+            filename: Original filename for the response
+
+        Returns:
+            FujiRecipeResponse: Parsed Fujifilm recipe data
+        """
+        # Walk the precompiled field table once; the first present tag
+        # name wins, so fallback tags are explicit per field
+        recipe_kwargs = {
+            field: next((metadata[k] for k in keys if k in metadata), "Unknown")
+            for field, keys in _FUJI_MAP
+        }
+        film_simulation = recipe_kwargs["FilmSimulation"]
+
+        # Build comprehensive recipe information; model_construct skips
+        # Pydantic validation, which is redundant here because the values
+        # come straight from exiftool and the table above
+        recipe_info = RecipeDetails.model_construct(**recipe_kwargs)
 
         # Create a simplified recipe name from the film simulation
         recipe_name = (
             film_simulation.split("/")[1] if "/" in film_simulation else film_simulation
         )
 
-        # Get values and ensure they're converted to strings
-        aperture = metadata.get("Aperture", "Unknown")
-        iso = metadata.get("ISO", "Unknown")
-        focal_length = metadata.get("FocalLength", "Unknown")
-        shutter_speed = metadata.get("ShutterSpeed", "Unknown")
-
-        # Helper function to convert values to strings
-        def to_str(value):
-            return str(value) if value != "Unknown" else value
+        # Get values, converting to strings inline; missing tags default
+        # to the shared interned sentinel, so an identity check replaces
+        # per-value __eq__ calls and the closure they lived in
+        aperture = metadata.get("Aperture", _UNKNOWN)
+        iso = metadata.get("ISO", _UNKNOWN)
+        focal_length = metadata.get("FocalLength", _UNKNOWN)
+        shutter_speed = metadata.get("ShutterSpeed", _UNKNOWN)
 
-        response_data = FujiRecipeResponse(
-            filename=os.path.basename(file_path),
+        # Same unvalidated construction for the top-level response; every
+        # field is supplied explicitly and already a string
+        response_data = FujiRecipeResponse.model_construct(
+            filename=filename,
             recipe=recipe_name,
             recipe_details=recipe_info,
             date=metadata.get("DateTimeOriginal", "Unknown Date"),
             camera_model=metadata.get("Model", "Unknown Camera"),
             lens_model=metadata.get("LensModel", "Unknown Lens"),
-            aperture=to_str(aperture),
-            shutter_speed=to_str(shutter_speed),
-            iso=to_str(iso),
-            focal_length=to_str(focal_length),
+            aperture=aperture if aperture is _UNKNOWN else str(aperture),
+            shutter_speed=shutter_speed
+            if shutter_speed is _UNKNOWN
+            else str(shutter_speed),
+            iso=iso if iso is _UNKNOWN else str(iso),
+            focal_length=focal_length
+            if focal_length is _UNKNOWN
+            else str(focal_length),
         )
 
         return response_data
 
     @staticmethod
-    async def save_upload_file(file: UploadFile) -> Path:
+    async def save_upload_file(file: UploadFile, directory=None, filename=None) -> Path:
         """
         Save an uploaded file to the temporary directory.
 
         Args:
             file: The uploaded file
+            directory: Target directory (defaults to the app temp dir)
+            filename: Name to save under (defaults to the upload's name)
 
         Returns:
             Path: Path to the saved file
@@ -143,29 +866,178 @@ class ExifService:
         Raises:
             HTTPException: If there's an error saving the file
         """
-        # Ensure the temporary directory exists
-        temp_dir = ensure_directory_exists(settings.TEMP_DIR)
+        # Ensure the target directory exists
+        temp_dir = ensure_directory_exists(directory or settings.TEMP_DIR)
 
-        # Create full path for the saved file
-        file_path = temp_dir / file.filename
+        # Check the magic number before any disk I/O; a rejected upload
+        # costs a 16-byte read instead of a full write
+        header = await file.read(16)
+        await file.seek(0)
+        if not validate_image_magic(header):
+            raise HTTPException(
+                status_code=400,
+                detail="File content does not match a supported image format",
+            )
+
+        # Reserve the destination. Callers that pass an explicit filename
+        # own a private directory (the batch route), so the name is used
+        # as-is; default saves go into the shared temp dir, where mkstemp
+        # picks a unique per-request name so concurrent uploads of the
+        # same filename can never touch each other's files. Both paths
+        # create the file exclusively with owner-only permissions.
+        if filename is not None:
+            file_path = Path(temp_dir) / sanitize_filename(filename)
+            try:
+                dst_fd = ExifService._open_exclusive(file_path)
+            except FileExistsError:
+                raise HTTPException(
+                    status_code=500,
+                    detail="Error saving file: destination already exists",
+                )
+        else:
+            dst_fd, reserved = tempfile.mkstemp(
+                dir=temp_dir, suffix="_" + sanitize_filename(file.filename)
+            )
+            file_path = Path(reserved)
 
         try:
-            # Save the uploaded file
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            # Run the whole copy loop in the threadpool: one thread hop
+            # for the file instead of a hop per chunk, and the event loop
+            # never blocks on disk writes
+            await run_in_threadpool(
+                ExifService._copy_upload_sync,
+                file.file,
+                dst_fd,
+                getattr(file, "size", None),
+            )
 
             return file_path
         except Exception as e:
+            # Don't leave a partial file behind for the sweeper
+            try:
+                os.unlink(file_path)
+            except OSError:
+                pass
             logger.error(f"Error saving file: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Error saving file: {str(e)}")
 
+    @staticmethod
+    def _open_exclusive(file_path):
+        """
+        Open a new upload destination, owner-only and created exclusively.
+
+        A collision means another request is writing under the same name,
+        so it surfaces as an error rather than clobbering that file;
+        callers wanting a guaranteed-unique name use mkstemp instead.
+
+        Args:
+            file_path: Destination path
+
+        Returns:
+            int: An open file descriptor
+
+        Raises:
+            FileExistsError: If the path already exists
+        """
+        return os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+
+    @staticmethod
+    def _copy_upload_sync(src, dst_fd, size=None):
+        """
+        Stream an upload's spool file to an open destination fd.
+
+        Takes ownership of dst_fd and closes it when done.
+
+        Args:
+            src: The upload's underlying file object
+            dst_fd: Open, writable destination file descriptor
+            size: Total upload size in bytes when known
+        """
+        # Spools that rolled to a real temp file can be copied in-kernel:
+        # sendfile moves the bytes fd-to-fd with no user-space bounce
+        # buffer and no Python allocation per chunk
+        if _SENDFILE_TO_PIPE and getattr(src, "_rolled", False):
+            src_fd = src.fileno()
+            total = size or os.fstat(src_fd).st_size
+            try:
+                if total and _HAS_FALLOCATE:
+                    try:
+                        os.posix_fallocate(dst_fd, 0, total)
+                    except OSError:
+                        pass
+                offset = 0
+                while offset < total:
+                    sent = os.sendfile(
+                        dst_fd, src_fd, offset, min(1 << 22, total - offset)
+                    )
+                    if sent == 0:
+                        break
+                    offset += sent
+            finally:
+                os.close(dst_fd)
+            return
+
+        # Check out a reusable copy buffer so the loop does readinto +
+        # write with no per-chunk bytes allocation
+        try:
+            buf = _buf_pool.get_nowait()
+        except Empty:
+            buf = bytearray(UPLOAD_CHUNK_SIZE)
+        view = memoryview(buf)
+        try:
+            with os.fdopen(dst_fd, "wb", buffering=0) as buffer:
+                # When the final size is known, reserve the extent up
+                # front so the filesystem allocates once instead of
+                # growing the file chunk by chunk (no-op where fallocate
+                # is unsupported)
+                if size and _HAS_FALLOCATE:
+                    try:
+                        os.posix_fallocate(buffer.fileno(), 0, size)
+                    except OSError:
+                        pass
+                while n := src.readinto(buf):
+                    buffer.write(view[:n])
+        finally:
+            view.release()
+            _buf_pool.put(buf)
+
     @staticmethod
     def cleanup_temp_files():
         """Clean up temporary files older than 1 hour."""
-        # This is a placeholder for a more sophisticated cleanup mechanism
-        # In a production environment, you might use a scheduled task
-        # to clean up files based on age, etc.
-        pass
+        # scandir hands back the stat data cached from the directory
+        # read, so age-checking the whole directory is one getdents pass
+        # plus an unlink per expired file
+        now = time.time()
+        try:
+            with os.scandir(settings.TEMP_DIR) as entries:
+                for entry in entries:
+                    try:
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                        if now - st.st_mtime > _SWEEP_MAX_AGE:
+                            os.unlink(entry.path)
+                    except OSError:
+                        # Raced with a request deleting its own file
+                        continue
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    async def sweep_temp_files_forever():
+        """Periodically sweep expired temp files in the background.
+
+        Runs as a long-lived task created at startup; the scandir pass
+        happens on the default executor so the event loop never blocks
+        on directory I/O.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(_SWEEP_INTERVAL)
+            try:
+                await loop.run_in_executor(None, ExifService.cleanup_temp_files)
+            except Exception as e:
+                logger.warning(f"Temp file sweep failed: {str(e)}")
 
 
 # Create a singleton instance
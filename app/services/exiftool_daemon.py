@@ -0,0 +1,215 @@
+"""Persistent ExifTool daemon using the -stay_open protocol."""
+import logging
+import os
+import queue
+import subprocess
+import threading
+
+import orjson
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class ExifToolDaemonError(RuntimeError):
+    """Raised when the ExifTool daemon fails or returns unusable output."""
+
+
+class ExifToolDaemon:
+    """
+    Wrapper around a long-lived ``exiftool -stay_open True`` process.
+
+    Spawning exiftool per request pays the Perl interpreter startup on
+    every call, which usually dwarfs the actual parse. This keeps one
+    warm process alive for the lifetime of the application and sends it
+    commands over stdin, reading each reply up to the ``{ready}``
+    sentinel. Access to the pipe is serialized with a lock since the
+    protocol is strictly request/response.
+    """
+
+    def __init__(self):
+        self._process = None
+        self._lock = threading.Lock()
+        self._counter = 0
+        self._started = False
+
+    def _start_locked(self) -> None:
+        """Spawn the daemon process (lock held by caller)."""
+        self._process = subprocess.Popen(
+            ["exiftool", "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._started = True
+        logger.info("Started exiftool daemon (pid %s)", self._process.pid)
+
+    def start(self) -> None:
+        """Start the daemon process if it is not already running."""
+        with self._lock:
+            if self._is_running():
+                return
+            self._start_locked()
+
+    def stop(self) -> None:
+        """Shut down the daemon process cleanly."""
+        with self._lock:
+            if self._process is None:
+                return
+            try:
+                if self._process.poll() is None:
+                    self._process.stdin.write(b"-stay_open\nFalse\n")
+                    self._process.stdin.flush()
+                    self._process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._process.kill()
+            finally:
+                self._process = None
+                self._started = False
+                logger.info("Stopped exiftool daemon")
+
+    def _is_running(self) -> bool:
+        """Check whether the daemon process is alive (lock held by caller)."""
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the daemon process is currently alive."""
+        with self._lock:
+            return self._is_running()
+
+    def execute_json(self, *args: str) -> list:
+        """
+        Run an exiftool command through the daemon and parse JSON output.
+
+        Args:
+            args: exiftool arguments, one per element (e.g. "-j", path)
+
+        Returns:
+            list: The parsed JSON array emitted by exiftool
+
+        Raises:
+            ExifToolDaemonError: If the daemon is not running, dies
+                mid-command, or emits invalid JSON
+        """
+        with self._lock:
+            if not self._is_running():
+                # Respawn transparently if the process died after a
+                # successful start; otherwise callers must start() first
+                if not self._started:
+                    raise ExifToolDaemonError("exiftool daemon is not running")
+                logger.warning("exiftool daemon died; restarting")
+                try:
+                    self._start_locked()
+                except OSError as e:
+                    raise ExifToolDaemonError(
+                        f"Could not restart exiftool daemon: {e}"
+                    )
+
+            self._counter += 1
+            tag = str(self._counter)
+            command = "\n".join(args) + f"\n-execute{tag}\n"
+            sentinel = f"{{ready{tag}}}".encode()
+
+            try:
+                self._process.stdin.write(command.encode())
+                self._process.stdin.flush()
+
+                output = bytearray()
+                while True:
+                    line = self._process.stdout.readline()
+                    if not line:
+                        raise ExifToolDaemonError("exiftool daemon closed stdout")
+                    if line.strip() == sentinel:
+                        break
+                    output += line
+            except (OSError, ExifToolDaemonError):
+                # The pipe is in an unknown state; drop the process so the
+                # next start() call gets a fresh one
+                self._process.kill()
+                self._process = None
+                raise
+
+        if not output.strip():
+            return []
+
+        try:
+            return orjson.loads(bytes(output))
+        except orjson.JSONDecodeError as e:
+            raise ExifToolDaemonError(f"Invalid JSON from exiftool daemon: {e}")
+
+
+class ExifToolDaemonPool:
+    """
+    Fixed-size pool of stay_open ExifTool workers.
+
+    A single daemon serializes every parse behind one pipe, so under
+    concurrent uploads requests queue behind one exiftool process. The
+    pool keeps several warm workers and checks one out per command, so
+    parse throughput scales up to the pool size on multi-core hosts.
+    It presents the same start/stop/execute_json interface as a single
+    daemon.
+    """
+
+    def __init__(self, size: int = 4):
+        self._workers = [ExifToolDaemon() for _ in range(size)]
+        # Idle workers; executor threads block here when all are busy
+        self._idle = queue.SimpleQueue()
+
+    def start(self) -> None:
+        """Start every worker that is not already running."""
+        for worker in self._workers:
+            was_running = worker.is_running
+            worker.start()
+            if not was_running:
+                self._idle.put(worker)
+
+    def stop(self) -> None:
+        """Shut down all worker processes cleanly."""
+        for worker in self._workers:
+            worker.stop()
+        # Drain the idle queue; stopped workers must not be checked out
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+
+    @property
+    def is_running(self) -> bool:
+        """Whether at least one worker process is currently alive."""
+        return any(worker.is_running for worker in self._workers)
+
+    def execute_json(self, *args: str) -> list:
+        """
+        Run an exiftool command on the next idle worker.
+
+        Args:
+            args: exiftool arguments, one per element (e.g. "-j", path)
+
+        Returns:
+            list: The parsed JSON array emitted by exiftool
+
+        Raises:
+            ExifToolDaemonError: If the pool has not been started or the
+                worker fails mid-command
+        """
+        try:
+            worker = self._idle.get_nowait()
+        except queue.Empty:
+            if not self.is_running:
+                raise ExifToolDaemonError("exiftool daemon pool is not running")
+            # All workers busy; wait for the next one to come back
+            worker = self._idle.get()
+        try:
+            return worker.execute_json(*args)
+        finally:
+            self._idle.put(worker)
+
+
+# Pool size is tunable without code changes; each worker is one warm
+# exiftool process held for the lifetime of the application
+_POOL_SIZE = int(os.getenv("EXIFTOOL_POOL_SIZE", "4"))
+
+# Create a singleton instance, started/stopped by the application lifecycle
+exiftool_daemon = ExifToolDaemonPool(size=_POOL_SIZE)
@@ -17,7 +17,7 @@ def run_server(
     host: str = settings.HOST,
     port: int = settings.PORT,
     reload: bool = False,
-    workers: int = 1,
+    workers: int = 0,
     log_level: str = "info",
     production: bool = False,
 ) -> None:
@@ -28,10 +28,16 @@ def run_server(
         host: Host to bind the server to
         port: Port to bind the server to
         reload: Enable auto-reload for development
-        workers: Number of worker processes
+        workers: Number of worker processes (0 = one per CPU, min 2)
         log_level: Logging level (debug, info, warning, error, critical)
         production: Use production settings
     """
+    # Scale workers with the machine unless reloading (reload requires
+    # a single process); resolved up front so the gunicorn command line
+    # below never sees the unresolved 0 default
+    if not reload and workers < 1:
+        workers = max(2, os.cpu_count() or 2)
+
     if production:
         print("For production deployment, use gunicorn:")
         print(
@@ -42,6 +48,16 @@ def run_server(
     # Development mode
     print(f"Starting development server at {host}:{port}")
 
+    # Prefer the C event loop and HTTP parser; fall back to the stock
+    # asyncio loop where uvloop is unavailable (e.g. Windows)
+    try:
+        import uvloop  # noqa: F401
+
+        loop, http = "uvloop", "httptools"
+    except ImportError:
+        print("Warning: uvloop not available, using asyncio event loop")
+        loop, http = "asyncio", "auto"
+
     try:
         uvicorn.run(
             "app.main:app",
@@ -50,6 +66,8 @@ def run_server(
             reload=reload,
             workers=workers if workers > 1 else 1,
             log_level=log_level,
+            loop=loop,
+            http=http,
         )
     except Exception as e:
         print(f"Error starting server: {str(e)}")
@@ -70,8 +88,8 @@ if __name__ == "__main__":
     parser.add_argument(
         "--workers",
         type=int,
-        default=1,
-        help="Number of worker processes (development only)",
+        default=0,
+        help="Number of worker processes (development only; 0 = one per CPU)",
     )
     parser.add_argument(
         "--log-level",